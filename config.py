@@ -11,17 +11,48 @@ Functions:
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from os.path import dirname, join
 
 from constants import DEFAULT_CHUNK_SIZE, MIN_CHUNK_SIZE
-from dotenv import load_dotenv
-
 
+# The environment variables get_env_vars reads. Their current values form
+# the cache key for the parsed EnvVars, so a cached result is only reused
+# while the relevant environment is byte-for-byte identical.
+_ENV_KEYS = (
+    "GH_APP_ID",
+    "GH_APP_INSTALLATION_ID",
+    "GH_APP_PRIVATE_KEY",
+    "GITHUB_APP_ENTERPRISE_ONLY",
+    "GH_TOKEN",
+    "GH_ENTERPRISE_URL",
+    "REPOSITORY",
+    "REPORT_TITLE",
+    "OUTPUT_FILE",
+    "RATE_LIMIT_BYPASS",
+    "CHUNK_SIZE",
+    "OWNING_TEAM",
+)
+
+# Tracks whether the .env file has been loaded so repeated get_env_vars
+# calls don't re-read and re-parse it from disk.
+_DOTENV_LOADED = False
+
+# Common spellings of "true" checked before falling back to the
+# case-insensitive comparison, avoiding the strip/lower allocations.
+_TRUE_LITERALS = frozenset({"true", "True", "TRUE"})
+
+
+@dataclass(slots=True, frozen=True)
 class EnvVars:
     # pylint: disable=too-many-instance-attributes
     """
     Environment variables
 
+    Instances are immutable and use slots, so they carry no per-instance
+    __dict__ and attribute access resolves through fixed slot offsets.
+
     Attributes:
         gh_app_id (int | None): The GitHub App ID to use for authentication
         gh_app_installation_id (int | None): The GitHub App Installation ID to use for
@@ -36,60 +67,27 @@ class EnvVars:
         output_file (str): The name of the file to write the report to
         rate_limit_bypass (bool): If set to TRUE, bypass the rate limit for the GitHub API
         chunk_size (int): The number of items to process at once when fetching data (for memory efficiency)
-        owning_team (list[str] | None): Optional list of usernames that comprise the owning team (overrides algorithm)
+        owning_team (tuple[str, ...] | None): Optional usernames that comprise the owning team (overrides algorithm)
     """
 
-    def __init__(
-        self,
-        gh_app_id: int | None,
-        gh_app_installation_id: int | None,
-        gh_app_private_key_bytes: bytes,
-        gh_app_enterprise_only: bool,
-        gh_token: str | None,
-        ghe: str | None,
-        report_title: str,
-        owner: str,
-        repo: str,
-        output_file: str,
-        rate_limit_bypass: bool = False,
-        chunk_size: int = 100,
-        owning_team: list[str] | None = None,
-    ):
-        self.gh_app_id = gh_app_id
-        self.gh_app_installation_id = gh_app_installation_id
-        self.gh_app_private_key_bytes = gh_app_private_key_bytes
-        self.gh_app_enterprise_only = gh_app_enterprise_only
-        self.gh_token = gh_token
-        self.ghe = ghe
-        self.report_title = report_title
-        self.owner = owner
-        self.repo = repo
-        self.output_file = output_file
-        self.rate_limit_bypass = rate_limit_bypass
-        self.chunk_size = chunk_size
-        self.owning_team = owning_team
-
-    def __repr__(self):
-        return (
-            f"EnvVars("
-            f"{self.gh_app_id},"
-            f"{self.gh_app_installation_id},"
-            f"{self.gh_app_private_key_bytes},"
-            f"{self.gh_app_enterprise_only},"
-            f"{self.gh_token},"
-            f"{self.ghe},"
-            f"{self.report_title},"
-            f"{self.owner},"
-            f"{self.repo},"
-            f"{self.output_file},"
-            f"{self.rate_limit_bypass},"
-            f"{self.chunk_size},"
-            f"{self.owning_team}"
-            ")"
-        )
-
-
-def get_bool_env_var(env_var_name: str, default: bool = False) -> bool:
+    gh_app_id: int | None
+    gh_app_installation_id: int | None
+    gh_app_private_key_bytes: bytes
+    gh_app_enterprise_only: bool
+    gh_token: str | None
+    ghe: str | None
+    report_title: str
+    owner: str
+    repo: str
+    output_file: str
+    rate_limit_bypass: bool = False
+    chunk_size: int = 100
+    owning_team: tuple[str, ...] | None = None
+
+
+def get_bool_env_var(
+    env_var_name: str, default: bool = False, env: dict[str, str] | None = None
+) -> bool:
     """Get a boolean environment variable with proper type conversion.
 
     This function retrieves an environment variable and converts it to a boolean.
@@ -100,6 +98,10 @@ def get_bool_env_var(env_var_name: str, default: bool = False) -> bool:
         env_var_name (str): The name of the environment variable to retrieve.
         default (bool, optional): The default value to return if the environment
                                  variable is not set or is empty. Defaults to False.
+        env (dict[str, str] | None, optional): An environment snapshot to read
+                                              from instead of os.environ. Lets
+                                              callers that read many variables
+                                              take the snapshot once.
 
     Returns:
         bool: True if the environment variable is set to "true" (case-insensitive),
@@ -112,13 +114,16 @@ def get_bool_env_var(env_var_name: str, default: bool = False) -> bool:
         >>> get_bool_env_var('NONEXISTENT_VAR', default=True)
         True
     """
-    ev = os.environ.get(env_var_name, "")
+    source = env if env is not None else os.environ
+    ev = source.get(env_var_name, "")
     if ev == "" and default:
         return default
+    if ev in _TRUE_LITERALS:
+        return True
     return ev.strip().lower() == "true"
 
 
-def get_int_env_var(env_var_name: str) -> int | None:
+def get_int_env_var(env_var_name: str, env: dict[str, str] | None = None) -> int | None:
     """Get an integer environment variable with proper type conversion and validation.
 
     This function retrieves an environment variable and attempts to convert it to an integer.
@@ -126,6 +131,8 @@ def get_int_env_var(env_var_name: str) -> int | None:
 
     Args:
         env_var_name (str): The name of the environment variable to retrieve.
+        env (dict[str, str] | None, optional): An environment snapshot to read
+                                              from instead of os.environ.
 
     Returns:
         int | None: The value of the environment variable as an integer, or None if
@@ -141,7 +148,8 @@ def get_int_env_var(env_var_name: str) -> int | None:
         >>> get_int_env_var('INVALID_INT')
         None
     """
-    env_var = os.environ.get(env_var_name)
+    source = env if env is not None else os.environ
+    env_var = source.get(env_var_name)
     if env_var is None or not env_var.strip():
         return None
     try:
@@ -199,21 +207,58 @@ def get_env_vars(test: bool = False) -> EnvVars:
         >>> print(env_vars.repo)
         'Hello-World'
     """
-    if not test:  # pragma: no cover
+    global _DOTENV_LOADED
+    if not test and not _DOTENV_LOADED:  # pragma: no cover
+        # Imported lazily so importing config doesn't pull in dotenv for
+        # callers (and tests) that never load a .env file.
+        from dotenv import load_dotenv  # pylint: disable=import-outside-toplevel
+
         dotenv_path = join(dirname(__file__), ".env")
         load_dotenv(dotenv_path)
+        _DOTENV_LOADED = True
+
+    # Snapshot only the variables the parser reads; the tuple doubles as
+    # the memoization key, so an unchanged environment returns the cached
+    # (immutable) EnvVars without re-parsing.
+    env_items = tuple((key, os.environ.get(key)) for key in _ENV_KEYS)
+    return _parse_env_items(env_items)
+
+
+@lru_cache(maxsize=8)
+def _parse_env_items(env_items: tuple[tuple[str, str | None], ...]) -> EnvVars:
+    """
+    Parse a snapshot of environment values into an EnvVars instance.
 
-    gh_app_id = get_int_env_var("GH_APP_ID")
-    gh_app_private_key_bytes = os.environ.get("GH_APP_PRIVATE_KEY", "").encode("utf8")
-    gh_app_installation_id = get_int_env_var("GH_APP_INSTALLATION_ID")
-    gh_app_enterprise_only = get_bool_env_var("GITHUB_APP_ENTERPRISE_ONLY")
+    Results are memoized on the snapshot itself, so repeated calls with an
+    identical environment skip the validation and string splitting below
+    and share one frozen EnvVars. Validation failures are not cached;
+    lru_cache recomputes on the next call and re-raises.
+
+    Args:
+        env_items (tuple[tuple[str, str | None], ...]): (name, value) pairs
+                                                        for every variable
+                                                        in _ENV_KEYS, with
+                                                        None for unset ones.
+
+    Returns:
+        EnvVars: The parsed and validated environment variables.
+
+    Raises:
+        ValueError: If required variables are missing or malformed.
+    """
+    env = {key: value for key, value in env_items if value is not None}
+
+    gh_app_id = get_int_env_var("GH_APP_ID", env)
+    gh_app_private_key_bytes = env.get("GH_APP_PRIVATE_KEY", "").encode("utf8")
+    gh_app_installation_id = get_int_env_var("GH_APP_INSTALLATION_ID", env)
+    gh_app_enterprise_only = get_bool_env_var("GITHUB_APP_ENTERPRISE_ONLY", env=env)
 
     if gh_app_id and (not gh_app_private_key_bytes or not gh_app_installation_id):
         raise ValueError(
             "GH_APP_ID set and GH_APP_INSTALLATION_ID or GH_APP_PRIVATE_KEY variable not set"
         )
 
-    gh_token = os.getenv("GH_TOKEN")
+    gh_token = env.get("GH_TOKEN")
     if (
         not gh_app_id
         and not gh_app_private_key_bytes
@@ -222,25 +267,27 @@ def get_env_vars(test: bool = False) -> EnvVars:
     ):
         raise ValueError("GH_TOKEN environment variable not set")
 
-    ghe = os.getenv("GH_ENTERPRISE_URL", default="").strip()
+    ghe = env.get("GH_ENTERPRISE_URL", "").strip()
 
-    repository = os.getenv("REPOSITORY", default="")
+    repository = env.get("REPOSITORY", "")
     if not repository:
         raise ValueError("REPOSITORY environment variable not set")
-    if "/" not in repository:
+    # partition scans the string once and reports a missing separator via
+    # the empty middle element, replacing the separate "/" check + split.
+    owner, sep, repo = repository.partition("/")
+    if not sep:
         raise ValueError(
             "REPOSITORY environment variable must be in the format 'owner/repo'"
         )
-    owner, repo = repository.split("/", 1)
 
-    report_title = os.getenv("REPORT_TITLE", "InnerSource Report")
-    output_file = os.getenv("OUTPUT_FILE")
+    report_title = env.get("REPORT_TITLE", "InnerSource Report")
+    output_file = env.get("OUTPUT_FILE")
     if not output_file:
         output_file = "innersource_report.md"
-    rate_limit_bypass = get_bool_env_var("RATE_LIMIT_BYPASS", False)
+    rate_limit_bypass = get_bool_env_var("RATE_LIMIT_BYPASS", False, env)
 
     # Get the chunk size for processing data in batches (for memory efficiency)
-    chunk_size_str = os.getenv("CHUNK_SIZE", str(DEFAULT_CHUNK_SIZE))
+    chunk_size_str = env.get("CHUNK_SIZE", str(DEFAULT_CHUNK_SIZE))
     try:
         chunk_size = int(chunk_size_str)
         # Ensure a reasonable minimum chunk size
@@ -249,19 +296,20 @@ def get_env_vars(test: bool = False) -> EnvVars:
         # Default to DEFAULT_CHUNK_SIZE if not a valid integer
         chunk_size = DEFAULT_CHUNK_SIZE
 
-    # Get optional owning team override (comma-separated list of usernames)
-    owning_team_str = os.getenv("OWNING_TEAM", "").strip()
-    owning_team = None
-    if owning_team_str:
-        # Parse comma-separated list and strip whitespace from each username
-        owning_team = [
-            username.strip()
-            for username in owning_team_str.split(",")
-            if username.strip()
-        ]
-        # If the list is empty after stripping, set to None
-        if not owning_team:
-            owning_team = None
+    # Get optional owning team override (comma-separated list of usernames).
+    # The inner generator strips each entry exactly once; blank entries drop
+    # out in the filter, and an all-blank value collapses to None. A tuple
+    # keeps the cached EnvVars snapshot fully immutable (and hashable).
+    owning_team = (
+        tuple(
+            username
+            for username in (
+                part.strip() for part in env.get("OWNING_TEAM", "").split(",")
+            )
+            if username
+        )
+        or None
+    )
 
     return EnvVars(
         gh_app_id,
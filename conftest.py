@@ -0,0 +1,11 @@
+"""Shared pytest fixtures for the test suite."""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture(name="mock_repo")
+def mock_repo_fixture():
+    """Stand-in for the repository object; only full_name is read."""
+    return SimpleNamespace(full_name="owner/repo")
@@ -7,6 +7,10 @@ print statements with proper logging levels.
 import logging
 import sys
 
+# Resolved once at import; logging.getLogger takes the registry lock and
+# does a dict lookup per call, and get_logger is called from every helper.
+_LOGGER = logging.getLogger("innersource_measure")
+
 
 def setup_logging(level: str = "INFO") -> logging.Logger:
     """Configure and return a logger for the InnerSource measurement tool.
@@ -55,4 +59,4 @@ def get_logger() -> logging.Logger:
     Returns:
         logging.Logger: The configured logger for the application
     """
-    return logging.getLogger("innersource_measure")
+    return _LOGGER
@@ -17,6 +17,8 @@ Common Use Cases:
     - Preparing reports for different output formats with size constraints
 """
 
+import os
+
 
 def markdown_too_large_for_issue_body(file_path: str, max_char_count: int) -> bool:
     """
@@ -45,9 +47,22 @@ def markdown_too_large_for_issue_body(file_path: str, max_char_count: int) -> bo
         >>> if is_too_large:
         ...     print("File needs to be split for GitHub issues")
     """
+    # In UTF-8 the byte count is an upper bound on the character count, so
+    # a file whose size fits within the limit never needs to be opened.
+    if os.path.getsize(file_path) <= max_char_count:
+        return False
+
     with open(file_path, "r", encoding="utf-8") as file:
-        file_contents = file.read()
-        return len(file_contents) > max_char_count
+        # Stream the file and stop counting as soon as the limit is exceeded
+        # instead of materializing the full contents.
+        total_chars = 0
+        while True:
+            buffer = file.read(65536)
+            if not buffer:
+                return False
+            total_chars += len(buffer)
+            if total_chars > max_char_count:
+                return True
 
 
 def split_markdown_file(file_path: str, max_char_count: int) -> None:
@@ -73,6 +88,8 @@ def split_markdown_file(file_path: str, max_char_count: int) -> None:
         - Each new file contains a portion of the original content
         - Files are created in the same directory as the original file
         - The original file is not modified or deleted
+        - Content is streamed one chunk at a time, so memory usage stays
+          bounded by max_char_count regardless of the original file size
 
     File Naming:
         - Original file: "report.md"
@@ -88,12 +105,14 @@ def split_markdown_file(file_path: str, max_char_count: int) -> None:
         >>> split_markdown_file("large_report.md", 65535)
         >>> # This creates: large_report_0.md, large_report_1.md, etc.
     """
+    # Read and write one chunk at a time so peak memory stays bounded by
+    # max_char_count instead of twice the full file size.
     with open(file_path, "r", encoding="utf-8") as file:
-        file_contents = file.read()
-        contents_list = [
-            file_contents[i : i + max_char_count]
-            for i in range(0, len(file_contents), max_char_count)
-        ]
-        for i, content in enumerate(contents_list):
+        i = 0
+        while True:
+            content = file.read(max_char_count)
+            if not content:
+                break
             with open(f"{file_path[:-3]}_{i}.md", "w", encoding="utf-8") as new_file:
                 new_file.write(content)
+            i += 1
@@ -27,6 +27,24 @@ Dependencies:
     - GitHub API data structures for repository information
 """
 
+from pathlib import Path
+
+# Static report fragments hoisted to module scope so every call reuses the
+# same string objects.
+_TEAM_OWNERSHIP_EXPLICIT = "### Team ownership is explicitly specified\n\n"
+_NO_AUTHOR_INFO = "### Original commit author information not available\n\n"
+_HEADER_TEAM_MEMBERS = "## Team Members that Own the Repo:\n"
+_NO_TEAM_MEMBERS = "No team members available.\n"
+_HEADER_ALL_CONTRIBUTORS = "\n## All Contributors:\n"
+_NO_CONTRIBUTORS = "No contributors found.\n"
+_HEADER_INNERSOURCE_CONTRIBUTORS = "\n## Innersource Contributors:\n"
+_NO_INNERSOURCE_CONTRIBUTORS = "No InnerSource contributors found.\n"
+_HEADER_INNERSOURCE_COUNTS = "\n## Innersource Contribution Counts:\n"
+_NO_INNERSOURCE_COUNTS = "No InnerSource contribution counts available.\n"
+_HEADER_TEAM_MEMBER_COUNTS = "\n## Team Member Contribution Counts:\n"
+_NO_TEAM_MEMBER_CONTRIBUTIONS = "No team member contributions found.\n"
+_NO_TEAM_MEMBER_COUNTS = "No team member contribution counts available.\n"
+
 
 def write_to_markdown(
     report_title="",
@@ -97,6 +115,8 @@ def write_to_markdown(
         - Creates a markdown file with the specified filename
         - Overwrites the file if it already exists
         - Writes UTF-8 encoded content
+        - Contributor and team-member lists are emitted in sorted order so
+          repeat runs over the same repository produce identical reports
 
     Report Structure:
         The generated report includes the following sections:
@@ -150,64 +170,134 @@ def write_to_markdown(
         ... )
     """
     output_file_name = output_file if output_file else "innersource_report.md"
-    with open(output_file_name, "w", encoding="utf-8") as report_file:
-        report_file.write(f"# {report_title}\n\n")
-        # Check if repo_data is None to handle test cases
-        if repo_data is None:
-            report_file.write("no op\n\n")
-            return
-        report_file.write(f"## Repository: {repo_data.full_name}\n\n")
-        report_file.write(f"### InnerSource Ratio: {innersource_ratio:.2%}\n\n")
-        if team_ownership_explicitly_specified:
-            report_file.write("### Team ownership is explicitly specified\n\n")
-        elif original_commit_author and original_commit_author_manager:
-            report_file.write(
-                f"### Original Commit Author: {original_commit_author} (Manager: {original_commit_author_manager})\n\n"
-            )
-        elif original_commit_author:
-            report_file.write(
-                f"### Original Commit Author: {original_commit_author}\n\n"
-            )
-        else:
-            report_file.write(
-                "### Original commit author information not available\n\n"
-            )
-        report_file.write("## Team Members that Own the Repo:\n")
-        if team_members_that_own_the_repo:
-            for member in team_members_that_own_the_repo:
-                report_file.write(f"- {member}\n")
-        else:
-            report_file.write("No team members available.\n")
 
-        report_file.write("\n## All Contributors:\n")
-        if all_contributors:
-            for contributor in all_contributors:
-                report_file.write(f"- {contributor}\n")
-        else:
-            report_file.write("No contributors found.\n")
+    # Check if repo_data is None to handle test cases. This degenerate report
+    # is two fragments, so write it directly without buffered-IO scaffolding.
+    if repo_data is None:
+        Path(output_file_name).write_bytes(
+            f"# {report_title}\n\nno op\n\n".encode("utf-8")
+        )
+        return
 
-        report_file.write("\n## Innersource Contributors:\n")
-        if innersource_contributors:
-            for contributor in innersource_contributors:
-                report_file.write(f"- {contributor}\n")
-        else:
-            report_file.write("No InnerSource contributors found.\n")
+    parts = _render_report_parts(
+        report_title=report_title,
+        innersource_ratio=innersource_ratio,
+        repo_full_name=repo_data.full_name,
+        original_commit_author=original_commit_author,
+        original_commit_author_manager=original_commit_author_manager,
+        team_members_that_own_the_repo=team_members_that_own_the_repo,
+        all_contributors=all_contributors,
+        innersource_contributors=innersource_contributors,
+        innersource_contribution_counts=innersource_contribution_counts,
+        team_member_contribution_counts=team_member_contribution_counts,
+        team_ownership_explicitly_specified=team_ownership_explicitly_specified,
+    )
 
-        report_file.write("\n## Innersource Contribution Counts:\n")
-        if innersource_contribution_counts:
-            for contributor, count in innersource_contribution_counts.items():
-                report_file.write(f"- {contributor}: {count} contributions\n")
-        else:
-            report_file.write("No InnerSource contribution counts available.\n")
-
-        report_file.write("\n## Team Member Contribution Counts:\n")
-        if team_member_contribution_counts:
-            found_contributions = False
-            for member, count in team_member_contribution_counts.items():
-                if count > 0:
-                    found_contributions = True
-                    report_file.write(f"- {member}: {count} contributions\n")
-            if not found_contributions:
-                report_file.write("No team member contributions found.\n")
+    # Binary mode skips the TextIOWrapper layer. writelines lets the buffered
+    # writer coalesce the encoded sections without first materializing one
+    # monolithic copy of the whole report.
+    with open(output_file_name, "wb", buffering=1 << 20) as report_file:
+        report_file.writelines(part.encode("utf-8") for part in parts)
+
+
+def _render_report_parts(
+    report_title,
+    innersource_ratio,
+    repo_full_name,
+    original_commit_author,
+    original_commit_author_manager,
+    team_members_that_own_the_repo,
+    all_contributors,
+    innersource_contributors,
+    innersource_contribution_counts,
+    team_member_contribution_counts,
+    team_ownership_explicitly_specified,
+) -> list[str]:
+    """
+    Render the report body as a list of markdown fragments.
+
+    This is the pure part of report generation: it takes already-computed
+    data and produces the section strings without touching the filesystem,
+    which keeps it independently testable and reusable.
+
+    Args:
+        Mirrors write_to_markdown, except repo_full_name is the repository's
+        full name string rather than the repository object.
+
+    Returns:
+        list[str]: The markdown fragments, in order, ready to be written.
+    """
+    # Materialize any generator inputs once so the sections below can test
+    # truthiness and iterate without silently consuming or re-running them.
+    if team_members_that_own_the_repo is not None and not isinstance(
+        team_members_that_own_the_repo, (list, tuple)
+    ):
+        team_members_that_own_the_repo = list(team_members_that_own_the_repo)
+    if all_contributors is not None and not isinstance(all_contributors, (list, tuple)):
+        all_contributors = list(all_contributors)
+    if innersource_contributors is not None and not isinstance(
+        innersource_contributors, (list, tuple)
+    ):
+        innersource_contributors = list(innersource_contributors)
+
+    # Accumulate the report in memory and emit it with a single write so the
+    # write phase doesn't pay per-line trips through the IO stack.
+    parts = [f"# {report_title}\n\n"]
+
+    parts.append(f"## Repository: {repo_full_name}\n\n")
+    parts.append(f"### InnerSource Ratio: {innersource_ratio:.2%}\n\n")
+    if team_ownership_explicitly_specified:
+        parts.append(_TEAM_OWNERSHIP_EXPLICIT)
+    elif original_commit_author and original_commit_author_manager:
+        parts.append(
+            f"### Original Commit Author: {original_commit_author} (Manager: {original_commit_author_manager})\n\n"
+        )
+    elif original_commit_author:
+        parts.append(f"### Original Commit Author: {original_commit_author}\n\n")
+    else:
+        parts.append(_NO_AUTHOR_INFO)
+    parts.append(_HEADER_TEAM_MEMBERS)
+    if team_members_that_own_the_repo:
+        parts.append("- " + "\n- ".join(sorted(team_members_that_own_the_repo)) + "\n")
+    else:
+        parts.append(_NO_TEAM_MEMBERS)
+
+    parts.append(_HEADER_ALL_CONTRIBUTORS)
+    if all_contributors:
+        parts.append("- " + "\n- ".join(sorted(all_contributors)) + "\n")
+    else:
+        parts.append(_NO_CONTRIBUTORS)
+
+    parts.append(_HEADER_INNERSOURCE_CONTRIBUTORS)
+    if innersource_contributors:
+        parts.append("- " + "\n- ".join(sorted(innersource_contributors)) + "\n")
+    else:
+        parts.append(_NO_INNERSOURCE_CONTRIBUTORS)
+
+    parts.append(_HEADER_INNERSOURCE_COUNTS)
+    if innersource_contribution_counts:
+        count_lines = [
+            f"{contributor}: {count} contributions"
+            for contributor, count in innersource_contribution_counts.items()
+        ]
+        parts.append("- " + "\n- ".join(count_lines) + "\n")
+    else:
+        parts.append(_NO_INNERSOURCE_COUNTS)
+
+    parts.append(_HEADER_TEAM_MEMBER_COUNTS)
+    if team_member_contribution_counts:
+        # Filter and format in the same pass; emptiness of the result tells
+        # us whether any team member contributed.
+        count_lines = [
+            f"{member}: {count} contributions"
+            for member, count in team_member_contribution_counts.items()
+            if count > 0
+        ]
+        if count_lines:
+            parts.append("- " + "\n- ".join(count_lines) + "\n")
         else:
-            report_file.write("No team member contribution counts available.\n")
+            parts.append(_NO_TEAM_MEMBER_CONTRIBUTIONS)
+    else:
+        parts.append(_NO_TEAM_MEMBER_COUNTS)
+
+    return parts
@@ -6,11 +6,27 @@ The results are then written to a markdown file.
 
 """
 
-import json
-import shutil
+import time
+from collections import Counter, defaultdict, deque
+from itertools import islice
 from pathlib import Path
 
-from auth import auth_to_github, get_github_app_installation_token
+# Prefer orjson for org-data parsing when available; it is an optional
+# dependency, so fall back to the stdlib parser if it isn't installed.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    import json
+
+    _json_loads = json.loads
+
+from auth import (
+    auth_to_github,
+    get_github_app_installation_token,
+    has_app_credentials,
+)
 from config import get_env_vars
 from constants import GITHUB_ISSUE_BODY_MAX_CHARS
 from logging_config import get_logger, setup_logging
@@ -18,6 +34,54 @@ from markdown_helpers import markdown_too_large_for_issue_body, split_markdown_f
 from markdown_writer import write_to_markdown
 from requests.structures import CaseInsensitiveDict
 
+# Remaining core-API requests below which the tool waits for the rate
+# limit window to reset instead of running into 403s mid-fetch.
+RATE_LIMIT_MINIMUM_REMAINING = 100
+
+
+def wait_for_api_refresh_if_needed(github_connection, rate_limit_bypass: bool) -> None:
+    """
+    Sleep until the GitHub API rate limit resets when headroom is low.
+
+    This function checks the remaining core-API request quota before the
+    paginated fetch loops start. If fewer than RATE_LIMIT_MINIMUM_REMAINING
+    requests remain, it sleeps until the reset timestamp reported by the API
+    so the run resumes with a full window instead of failing partway through.
+
+    Args:
+        github_connection (github3.GitHub): The authenticated GitHub connection
+                                            used to query the rate limit endpoint
+                                            (which does not itself consume quota).
+        rate_limit_bypass (bool): If True, skip the check entirely. Used for
+                                 GitHub Enterprise instances with rate
+                                 limiting disabled.
+
+    Returns:
+        None: This function may sleep as a side effect but returns nothing.
+    """
+    if rate_limit_bypass:
+        return
+
+    logger = get_logger()
+    try:
+        core = github_connection.rate_limit()["resources"]["core"]
+        remaining = core["remaining"]
+        reset_timestamp = core["reset"]
+    except (KeyError, TypeError):
+        logger.warning("Unable to read rate limit information. Continuing.")
+        return
+
+    logger.info("%s GitHub API requests remaining in this window", remaining)
+    if remaining >= RATE_LIMIT_MINIMUM_REMAINING:
+        return
+
+    wait_seconds = max(reset_timestamp - time.time(), 0) + 1
+    logger.info(
+        "Rate limit nearly exhausted. Sleeping %d seconds until it resets...",
+        wait_seconds,
+    )
+    time.sleep(wait_seconds)
+
 
 def evaluate_markdown_file_size(output_file: str) -> None:
     """
@@ -46,8 +110,10 @@ def evaluate_markdown_file_size(output_file: str) -> None:
 
     if markdown_too_large_for_issue_body(output_file_name, max_char_count):
         split_markdown_file(output_file_name, max_char_count)
-        shutil.move(output_file_name, f"{file_name_without_extension}_full.md")
-        shutil.move(f"{file_name_without_extension}_0.md", output_file_name)
+        # Path.replace is a single rename(2) syscall; shutil.move stats the
+        # destination and carries a copy+delete fallback this swap never needs
+        Path(output_file_name).replace(f"{file_name_without_extension}_full.md")
+        Path(f"{file_name_without_extension}_0.md").replace(output_file_name)
         logger.info(
             "The markdown file is too large for GitHub issue body and has been "
             "split into multiple files. ie. %s, %s_1.md, etc. "
@@ -102,7 +168,7 @@ def main():  # pragma: no cover
     report_title = env_vars.report_title
     output_file = env_vars.output_file
     owning_team = env_vars.owning_team
-    # rate_limit_bypass = env_vars.rate_limit_bypass
+    rate_limit_bypass = env_vars.rate_limit_bypass
 
     ghe = env_vars.ghe
     gh_app_id = env_vars.gh_app_id
@@ -120,7 +186,9 @@ def main():  # pragma: no cover
         gh_app_enterprise_only,
     )
 
-    if not token and gh_app_id and gh_app_installation_id and gh_app_private_key_bytes:
+    if not token and has_app_credentials(
+        gh_app_id, gh_app_installation_id, gh_app_private_key_bytes
+    ):
         token = get_github_app_installation_token(
             ghe, gh_app_id, gh_app_private_key_bytes, gh_app_installation_id
         )
@@ -144,33 +212,34 @@ def main():  # pragma: no cover
         org_data_path = Path("org-data.json")
         if org_data_path.exists():
             logger.info("Reading in org data from org-data.json...")
-            with open(org_data_path, "r", encoding="utf-8") as org_file:
-                raw_org_data = json.load(org_file)
+            # Parse from bytes: skips the text-mode decode and lets orjson
+            # run when it is installed
+            raw_org_data = _json_loads(org_data_path.read_bytes())
             # Wrap org_data in case-insensitive dictionary for username lookups
             org_data = CaseInsensitiveDict(raw_org_data)
             logger.info("Org data read successfully.")
-        else:
-            logger.warning(
-                "No org data found. InnerSource collaboration cannot be measured."
-            )
 
-        if org_data:
-            logger.info("Org data found. Measuring InnerSource collaboration...")
-        else:
+        # Covers both a missing file and one that parsed to an empty org chart
+        if not org_data:
             logger.error(
                 "No org data found. InnerSource collaboration cannot be measured."
             )
             return
 
-        # Initialize contributor lists and team members list
-        all_contributors = []
-        innersource_contributors = []
+        logger.info("Org data found. Measuring InnerSource collaboration...")
+
+        # Initialize contributor sets and team members list. Sets make the
+        # later membership and tally steps O(1) and shrug off any duplicate
+        # entries pagination might hand back; the report sorts them anyway.
+        all_contributors = set()
+        innersource_contributors = set()
         team_members_that_own_the_repo = []
 
         # Check if owning team is explicitly specified
         if owning_team:
             logger.info("Using explicitly specified owning team: %s", owning_team)
             team_members_that_own_the_repo = owning_team
+            team_members_set = set(owning_team)
             # Set variables to None since they're not used when team is specified
             original_commit_author = None
             original_commit_author_manager = None
@@ -186,10 +255,8 @@ def main():  # pragma: no cover
             # For repositories with unusual commit ordering, we'll get the first commit from the first page
             try:
                 original_commit = next(commits_iterator)
-                original_commit_author = (
-                    original_commit.author.login
-                    if hasattr(original_commit.author, "login")
-                    else None
+                original_commit_author = getattr(
+                    original_commit.author, "login", None
                 )
                 logger.info("Found original commit by %s", original_commit_author)
             except StopIteration:
@@ -212,39 +279,31 @@ def main():  # pragma: no cover
                 original_commit_author,
                 original_commit_author_manager,
             )
-            # Create a dictionary mapping users to their managers for faster lookups
-            user_to_manager = {}
-            manager_to_reports = {}
-
+            # Create a reverse index mapping each manager to their direct
+            # reports in a single pass over the org chart
+            manager_to_reports = defaultdict(list)
             for user, data in org_data.items():
-                manager = data["manager"]
-                user_to_manager[user] = manager
-
-                # Also create reverse mapping of manager to direct reports
-                if manager not in manager_to_reports:
-                    manager_to_reports[manager] = []
-                manager_to_reports[manager].append(user)
+                manager_to_reports[data["manager"]].append(user)
 
-            # Find all users that report up to the same manager as the original commit author
+            # Find all users that report up to the original commit author's
+            # manager with a breadth-first walk over the reverse index. This
+            # visits each user at most once instead of re-scanning the org
+            # chart against a growing membership list, and it is not
+            # sensitive to the iteration order of the org data.
             team_members_that_own_the_repo.append(original_commit_author)
             team_members_that_own_the_repo.append(original_commit_author_manager)
+            team_members_set = {original_commit_author, original_commit_author_manager}
 
-            # Add all users reporting to the same manager
-            if original_commit_author_manager in manager_to_reports:
-                team_members_that_own_the_repo.extend(
-                    manager_to_reports[original_commit_author_manager]
-                )
-
-            # Add everyone that has one of the team members listed as their manager
-            for user, manager in user_to_manager.items():
-                if (
-                    manager in team_members_that_own_the_repo
-                    and user not in team_members_that_own_the_repo
-                ):
-                    team_members_that_own_the_repo.append(user)
-
-            # Remove duplicates from the team members list
-            team_members_that_own_the_repo = list(set(team_members_that_own_the_repo))
+            pending_managers = deque(
+                (original_commit_author_manager, original_commit_author)
+            )
+            while pending_managers:
+                manager = pending_managers.popleft()
+                for user in manager_to_reports.get(manager, ()):
+                    if user not in team_members_set:
+                        team_members_set.add(user)
+                        team_members_that_own_the_repo.append(user)
+                        pending_managers.append(user)
             logger.debug(
                 "Team members that own the repo: %s", team_members_that_own_the_repo
             )
@@ -253,7 +312,7 @@ def main():  # pragma: no cover
         # and if not, add them to the innersource contributors list
         logger.info("Analyzing all contributors in the repository...")
         for contributor in repo_data.contributors():
-            all_contributors.append(contributor.login)
+            all_contributors.add(contributor.login)
 
             # Check if contributor is not found in org chart
             if contributor.login not in org_data:
@@ -264,15 +323,21 @@ def main():  # pragma: no cover
                 )
                 continue
 
+            # Bot logins always carry the [bot] suffix, so a tail compare
+            # replaces the substring scan
             if (
-                contributor.login not in team_members_that_own_the_repo
-                and "[bot]" not in contributor.login
+                contributor.login not in team_members_set
+                and not contributor.login.endswith("[bot]")
             ):
-                innersource_contributors.append(contributor.login)
+                innersource_contributors.add(contributor.login)
 
         logger.debug("All contributors: %s", all_contributors)
         logger.debug("Innersource contributors: %s", innersource_contributors)
 
+        # Make sure there is enough rate-limit headroom for the paginated
+        # fetches below before starting them
+        wait_for_api_refresh_if_needed(github_connection, rate_limit_bypass)
+
         # Process data in chunks to avoid memory issues while maintaining performance
         chunk_size = env_vars.chunk_size
         logger.info("Using chunk size of %s for data processing", chunk_size)
@@ -281,7 +346,7 @@ def main():  # pragma: no cover
 
         # Process commits in chunks
         logger.info("Processing commits in chunks...")
-        commit_author_counts = {}
+        commit_author_counts = Counter()
         total_commits = 0
 
         # GitHub API returns an iterator that internally handles pagination
@@ -289,23 +354,20 @@ def main():  # pragma: no cover
         commits_iterator = repo_data.commits()
         while True:
             # Process a chunk of commits
-            chunk = []
-            for _ in range(chunk_size):
-                try:
-                    chunk.append(next(commits_iterator))
-                except StopIteration:
-                    break
-
+            # islice pulls the whole chunk in C instead of a per-item
+            # next()/append loop under try/except
+            chunk = list(islice(commits_iterator, chunk_size))
             if not chunk:
                 break
 
-            # Update counts for this chunk
-            for commit in chunk:
-                if hasattr(commit.author, "login"):
-                    author = commit.author.login
-                    commit_author_counts[author] = (
-                        commit_author_counts.get(author, 0) + 1
-                    )
+            # Update counts for this chunk; Counter.update runs the
+            # accumulation in C instead of per-item dict lookups, and
+            # getattr with a default skips hasattr's try/except machinery
+            commit_author_counts.update(
+                login
+                for commit in chunk
+                if (login := getattr(commit.author, "login", None)) is not None
+            )
 
             total_commits += len(chunk)
             logger.debug("  Processed %s commits so far...", total_commits)
@@ -314,7 +376,7 @@ def main():  # pragma: no cover
 
         # Process pull requests in chunks
         logger.info("Processing pull requests in chunks...")
-        pr_author_counts = {}
+        pr_author_counts = Counter()
         total_prs = 0
 
         # GitHub API returns an iterator that internally handles pagination
@@ -322,21 +384,18 @@ def main():  # pragma: no cover
         pulls_iterator = repo_data.pull_requests(state="all")
         while True:
             # Process a chunk of pull requests
-            chunk = []
-            for _ in range(chunk_size):
-                try:
-                    chunk.append(next(pulls_iterator))
-                except StopIteration:
-                    break
-
+            # islice pulls the whole chunk in C instead of a per-item
+            # next()/append loop under try/except
+            chunk = list(islice(pulls_iterator, chunk_size))
             if not chunk:
                 break
 
             # Update counts for this chunk
-            for pull in chunk:
-                if hasattr(pull.user, "login"):
-                    author = pull.user.login
-                    pr_author_counts[author] = pr_author_counts.get(author, 0) + 1
+            pr_author_counts.update(
+                login
+                for pull in chunk
+                if (login := getattr(pull.user, "login", None)) is not None
+            )
 
             total_prs += len(chunk)
             logger.debug("  Processed %s pull requests so far...", total_prs)
@@ -345,7 +404,7 @@ def main():  # pragma: no cover
 
         # Process issues in chunks
         logger.info("Processing issues in chunks...")
-        issue_author_counts = {}
+        issue_author_counts = Counter()
         total_issues = 0
 
         # GitHub API returns an iterator that internally handles pagination
@@ -353,72 +412,50 @@ def main():  # pragma: no cover
         issues_iterator = repo_data.issues(state="all")
         while True:
             # Process a chunk of issues
-            chunk = []
-            for _ in range(chunk_size):
-                try:
-                    chunk.append(next(issues_iterator))
-                except StopIteration:
-                    break
-
+            # islice pulls the whole chunk in C instead of a per-item
+            # next()/append loop under try/except
+            chunk = list(islice(issues_iterator, chunk_size))
             if not chunk:
                 break
 
             # Update counts for this chunk
-            for issue in chunk:
-                if hasattr(issue.user, "login"):
-                    author = issue.user.login
-                    issue_author_counts[author] = issue_author_counts.get(author, 0) + 1
+            issue_author_counts.update(
+                login
+                for issue in chunk
+                if (login := getattr(issue.user, "login", None)) is not None
+            )
 
             total_issues += len(chunk)
             logger.debug("  Processed %s issues so far...", total_issues)
 
         logger.info("Found and processed %s issues", total_issues)
 
-        # Count contributions for each innersource contributor using precompiled dictionaries
-        innersource_contribution_counts = {}
-        logger.info("Counting contributions for each innersource contributor...")
-        for contributor in innersource_contributors:
-            # Initialize counter for this contributor
-            innersource_contribution_counts[contributor] = 0
+        # Merge the three per-source counts once so each contributor below
+        # costs a single lookup instead of three
+        total_author_counts = Counter()
+        total_author_counts.update(commit_author_counts)
+        total_author_counts.update(pr_author_counts)
+        total_author_counts.update(issue_author_counts)
 
-            # Add commit counts from the precompiled dictionary
-            innersource_contribution_counts[contributor] += commit_author_counts.get(
-                contributor, 0
-            )
-
-            # Add PR counts from the precompiled dictionary
-            innersource_contribution_counts[contributor] += pr_author_counts.get(
-                contributor, 0
-            )
-
-            # Add issue counts from the precompiled dictionary
-            innersource_contribution_counts[contributor] += issue_author_counts.get(
-                contributor, 0
-            )
+        # Count contributions for each innersource contributor using the merged counts
+        logger.info("Counting contributions for each innersource contributor...")
+        # Sorted so the rendered counts section is stable across runs;
+        # set iteration order varies under hash randomization
+        innersource_contribution_counts = {
+            contributor: total_author_counts.get(contributor, 0)
+            for contributor in sorted(innersource_contributors)
+        }
 
         logger.debug("Innersource contribution counts:")
         for contributor, count in innersource_contribution_counts.items():
             logger.debug("  %s: %s contributions", contributor, count)
 
-        # Count contributions for each team member using precompiled dictionaries
-        team_member_contribution_counts = {}
+        # Count contributions for each team member using the merged counts
         logger.info("Counting contributions for each team member that owns the repo...")
-        for member in team_members_that_own_the_repo:
-            # Initialize counter for this team member
-            team_member_contribution_counts[member] = 0
-
-            # Add commit counts from the precompiled dictionary
-            team_member_contribution_counts[member] += commit_author_counts.get(
-                member, 0
-            )
-
-            # Add PR counts from the precompiled dictionary
-            team_member_contribution_counts[member] += pr_author_counts.get(member, 0)
-
-            # Add issue counts from the precompiled dictionary
-            team_member_contribution_counts[member] += issue_author_counts.get(
-                member, 0
-            )
+        team_member_contribution_counts = {
+            member: total_author_counts.get(member, 0)
+            for member in team_members_that_own_the_repo
+        }
 
         logger.debug("Team member contribution counts:")
         for member, count in team_member_contribution_counts.items():
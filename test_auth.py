@@ -8,9 +8,12 @@ Classes:
 
 """
 
+import json
 import unittest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
+import auth
 import github3
 import requests
 from auth import auth_to_github, get_github_app_installation_token
@@ -19,6 +22,11 @@ from auth import auth_to_github, get_github_app_installation_token
 class TestAuthToGithub(unittest.TestCase):
     """Test the auth_to_github function."""
 
+    def setUp(self):
+        """Clear the auth module caches before each test."""
+        auth._INSTALLATION_TOKEN_CACHE.clear()
+        auth._JWT_HEADER_CACHE.clear()
+
     @patch("github3.github.GitHub.login_as_app_installation")
     def test_auth_to_github_with_github_app(self, mock_login):
         """
@@ -71,7 +79,7 @@ class TestAuthToGithub(unittest.TestCase):
         self.assertEqual(result, mock)
 
     @patch("github3.apps.create_jwt_headers", MagicMock(return_value="gh_token"))
-    @patch("requests.post")
+    @patch("auth._SESSION.post")
     def test_get_github_app_installation_token(self, mock_post):
         """
         Test the get_github_app_installation_token function.
@@ -79,18 +87,21 @@ class TestAuthToGithub(unittest.TestCase):
         dummy_token = "dummytoken"
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"token": dummy_token}
+        mock_response.content = json.dumps({"token": dummy_token}).encode("utf-8")
         mock_post.return_value = mock_response
         mock_ghe = ""
 
         result = get_github_app_installation_token(
-            mock_ghe, b"gh_private_token", "gh_app_id", "gh_installation_id"
+            ghe=mock_ghe,
+            gh_app_id="gh_app_id",
+            gh_app_private_key_bytes=b"gh_private_token",
+            gh_app_installation_id="gh_installation_id",
         )
 
         self.assertEqual(result, dummy_token)
 
     @patch("github3.apps.create_jwt_headers", MagicMock(return_value="gh_token"))
-    @patch("auth.requests.post")
+    @patch("auth._SESSION.post")
     def test_get_github_app_installation_token_request_failure(self, mock_post):
         """
         Test the get_github_app_installation_token function returns None when the request fails.
@@ -109,6 +120,85 @@ class TestAuthToGithub(unittest.TestCase):
         # Assert that the result is None
         self.assertIsNone(result)
 
+    @patch("github3.apps.create_jwt_headers", MagicMock(return_value="gh_token"))
+    @patch("auth._SESSION.post")
+    def test_get_github_app_installation_token_cached(self, mock_post):
+        """
+        Test that a cached installation token with sufficient lifetime
+        remaining is reused instead of minting a new one.
+        """
+        dummy_token = "dummytoken"
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(
+            {"token": dummy_token, "expires_at": expires_at.isoformat()}
+        ).encode("utf-8")
+        mock_post.return_value = mock_response
+
+        first = get_github_app_installation_token(
+            ghe="",
+            gh_app_id="gh_app_id",
+            gh_app_private_key_bytes=b"gh_private_token",
+            gh_app_installation_id="gh_installation_id",
+        )
+        second = get_github_app_installation_token(
+            ghe="",
+            gh_app_id="gh_app_id",
+            gh_app_private_key_bytes=b"gh_private_token",
+            gh_app_installation_id="gh_installation_id",
+        )
+
+        self.assertEqual(first, dummy_token)
+        self.assertEqual(second, dummy_token)
+        mock_post.assert_called_once()
+
+    @patch("github3.apps.create_jwt_headers", MagicMock(return_value="gh_token"))
+    @patch("auth._SESSION.post")
+    def test_get_github_app_installation_token_cache_expired(self, mock_post):
+        """
+        Test that a cached installation token close to expiry is refreshed
+        with a new request.
+        """
+        dummy_token = "dummytoken"
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(
+            {"token": dummy_token, "expires_at": expires_at.isoformat()}
+        ).encode("utf-8")
+        mock_post.return_value = mock_response
+
+        # Seed the cache with a token that is within the expiry buffer
+        auth._INSTALLATION_TOKEN_CACHE[("", "gh_app_id", "gh_installation_id")] = (
+            "staletoken",
+            datetime.now(timezone.utc) + timedelta(minutes=1),
+        )
+
+        result = get_github_app_installation_token(
+            ghe="",
+            gh_app_id="gh_app_id",
+            gh_app_private_key_bytes=b"gh_private_token",
+            gh_app_installation_id="gh_installation_id",
+        )
+
+        self.assertEqual(result, dummy_token)
+        mock_post.assert_called_once()
+
+    @patch("github3.apps.create_jwt_headers")
+    def test_cached_jwt_headers_reuses_recent_signature(self, mock_create):
+        """
+        Test that _cached_jwt_headers only signs a JWT once for repeated
+        calls with the same app id and private key.
+        """
+        mock_create.return_value = {"Authorization": "Bearer jwt"}
+
+        first = auth._cached_jwt_headers(b"private_key", "gh_app_id")
+        second = auth._cached_jwt_headers(b"private_key", "gh_app_id")
+
+        self.assertEqual(first, second)
+        mock_create.assert_called_once()
+
     @patch("github3.login")
     def test_auth_to_github_invalid_credentials(self, mock_login):
         """
@@ -2,53 +2,31 @@
 Tests for config.py specifically for the chunk_size parameter
 """
 
+import pytest
 from config import get_env_vars
 
 
-class TestChunkSize:
+@pytest.mark.parametrize(
+    "chunk_size_value,expected_chunk_size",
+    [
+        # Default (100) when not specified
+        (None, 100),
+        # Custom value when specified
+        ("200", 200),
+        # Clamped to minimum 10 when too small
+        ("5", 10),
+        # Default (100) when not a valid integer
+        ("not_a_number", 100),
+    ],
+)
+def test_get_env_vars_chunk_size(monkeypatch, chunk_size_value, expected_chunk_size):
     """
-    Test cases for the chunk_size parameter in config.py
+    Test that chunk_size is parsed, defaulted, and clamped correctly
     """
+    monkeypatch.setenv("REPOSITORY", "owner/repo")
+    monkeypatch.setenv("GH_TOKEN", "token")
+    if chunk_size_value is not None:
+        monkeypatch.setenv("CHUNK_SIZE", chunk_size_value)
 
-    def test_get_env_vars_with_default_chunk_size(self, monkeypatch):
-        """
-        Test that chunk_size is set to default (100) when not specified
-        """
-        monkeypatch.setenv("REPOSITORY", "owner/repo")
-        monkeypatch.setenv("GH_TOKEN", "token")
-
-        env_vars = get_env_vars(test=True)
-        assert env_vars.chunk_size == 100
-
-    def test_get_env_vars_with_custom_chunk_size(self, monkeypatch):
-        """
-        Test that chunk_size is set to the custom value when specified
-        """
-        monkeypatch.setenv("REPOSITORY", "owner/repo")
-        monkeypatch.setenv("GH_TOKEN", "token")
-        monkeypatch.setenv("CHUNK_SIZE", "200")
-
-        env_vars = get_env_vars(test=True)
-        assert env_vars.chunk_size == 200
-
-    def test_get_env_vars_with_small_chunk_size(self, monkeypatch):
-        """
-        Test that chunk_size is set to minimum 10 when specified value is too small
-        """
-        monkeypatch.setenv("REPOSITORY", "owner/repo")
-        monkeypatch.setenv("GH_TOKEN", "token")
-        monkeypatch.setenv("CHUNK_SIZE", "5")
-
-        env_vars = get_env_vars(test=True)
-        assert env_vars.chunk_size == 10
-
-    def test_get_env_vars_with_invalid_chunk_size(self, monkeypatch):
-        """
-        Test that chunk_size is set to default (100) when an invalid value is specified
-        """
-        monkeypatch.setenv("REPOSITORY", "owner/repo")
-        monkeypatch.setenv("GH_TOKEN", "token")
-        monkeypatch.setenv("CHUNK_SIZE", "not_a_number")
-
-        env_vars = get_env_vars(test=True)
-        assert env_vars.chunk_size == 100
+    env_vars = get_env_vars(test=True)
+    assert env_vars.chunk_size == expected_chunk_size